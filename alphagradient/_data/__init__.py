@@ -1 +1 @@
-from ._datatools import AssetData, ValidData, get_data
+from ._datatools import AssetData, ValidData, bulk_get_data, get_data
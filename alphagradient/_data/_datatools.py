@@ -6,16 +6,19 @@ and datasets for use in AlphaGradient objects.
 
 TODO:
     * AUTOMATICALLY DETERMINE RESOLUTION OF DATASETS
-    * Implement dtype coercion on column validation
+    * Implement per-column dtype coercion on column validation
     * Type Hints
 """
 
 # Standard imports
 from __future__ import annotations
 
-from datetime import datetime, timedelta, time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, time
+from functools import lru_cache
 from numbers import Number
 from pathlib import Path
+import mmap
 import os
 
 # Third party imports
@@ -29,6 +32,8 @@ from .. import utils
 from typing import (
     TYPE_CHECKING,
     Any,
+    Iterable,
+    NamedTuple,
     Optional,
     Type,
     Union,
@@ -46,6 +51,15 @@ _AssetData: TypeAlias = "AssetData"
 ValidData = Union[Path, str, _AssetData, pd.DataFrame, np.ndarray, float]
 """Valid inputs for AssetData conversion"""
 
+_data_index: Optional[set[str]] = None
+"""Names of all files present in the global persistent path"""
+
+_data_index_path: Optional[Path] = None
+"""The directory from which the data index was built"""
+
+_data_index_mtime: Optional[int] = None
+"""Modification time (ns) of the indexed directory when the index was built"""
+
 
 def currency_info(base: Optional[str] = None, save: bool = False) -> pd.DataFrame:
     """Returns a DataFrame with all currency values updated relative
@@ -85,6 +99,98 @@ def currency_info(base: Optional[str] = None, save: bool = False) -> pd.DataFram
     return info
 
 
+def _get_data_index(base_path: Path) -> set[str]:
+    """
+    Returns the names of all files present in the global persistent path
+
+    The index is built with a single directory scan and reused for all
+    subsequent lookups. It is only rebuilt when the modification time of the
+    directory changes (ie. when files are added, removed or renamed), so that
+    checking for locally stored data costs one stat call rather than a scan.
+
+    Parameters:
+        base_path: The global persistent path
+
+    Returns:
+        A set of the file names present in the base path
+    """
+    global _data_index, _data_index_path, _data_index_mtime
+    try:
+        mtime: Optional[int] = os.stat(base_path).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+
+    if (
+        _data_index is None
+        or _data_index_path != base_path
+        or _data_index_mtime != mtime
+    ):
+        _data_index = set()
+        if mtime is not None:
+            _data_index = {
+                entry.name for entry in os.scandir(base_path) if entry.is_file()
+            }
+        _data_index_path, _data_index_mtime = base_path, mtime
+
+    return _data_index
+
+
+def _index_data_file(path: Path, mtime: int) -> None:
+    """
+    Adds a newly written file to the persistent data index without
+    requiring the directory to be scanned again
+
+    The recorded modification time is only advanced when the index was up to
+    date before the write. Otherwise, other files may have been written to the
+    directory since the last scan, and the stale time forces a rescan on the
+    next lookup.
+
+    Parameters:
+        path: The path of the newly written file
+
+        mtime: The modification time of its directory before the write
+    """
+    global _data_index_mtime
+    if _data_index is not None and path.parent == _data_index_path:
+        _data_index.add(path.name)
+        if _data_index_mtime == mtime:
+            _data_index_mtime = os.stat(path.parent).st_mtime_ns
+
+
+def _invalidate_data_index() -> None:
+    """Forces the persistent data index to be rebuilt on its next access"""
+    global _data_index
+    _data_index = None
+
+
+def _read_pickle(path: Path) -> Any:
+    """
+    Unpickles the file at the given path through a read-only memory map
+
+    Reading through the memory map lets the unpickler consume the file directly
+    from the OS page cache rather than through intermediate read buffers. The
+    map is handed to pd.read_pickle so that pickles written by older versions
+    of pandas are still loaded through its compatibility fallback.
+
+    Parameters:
+        path: The path to the pickled file
+
+    Returns:
+        The unpickled object
+
+    Raises:
+        EOFError: raised when the file is empty or truncated
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can not be memory mapped
+            raise EOFError(f"{path} is empty")
+        with mm:
+            return pd.read_pickle(mm)
+
+
 def get_data(asset: Asset) -> Optional[AssetData]:
     """
     Accesses locally stored data relevant to this asset
@@ -93,6 +199,9 @@ def get_data(asset: Asset) -> Optional[AssetData]:
     the persistent storage or a locally identified path (using CSVs, or other
     forms of storage for tabular data). It will return None if nothing is found
 
+    Persistent pickles are preferred, followed by raw parquet files (when
+    pyarrow or fastparquet is installed) and finally raw csv files
+
     Parameters:
         asset: The asset to retrieve data for
 
@@ -100,7 +209,6 @@ def get_data(asset: Asset) -> Optional[AssetData]:
         Stored dataset relevant to the asset. None if nothing is found
     """
     key = asset.key
-    data = None
 
     # Getting the global persistent path
     base_path = utils._global_persistent_path.fget(None)
@@ -109,22 +217,107 @@ def get_data(asset: Asset) -> Optional[AssetData]:
     if base_path is None:
         return None
 
+    # Only files present in the index are read from disk
+    index = _get_data_index(base_path)
+
     # Trying to get the data from persistent pickles
-    path = base_path.joinpath(f"{key}.p")
-    try:
-        with open(path, "rb") as data:
-            return AssetData(asset.__class__, pd.read_pickle(data), preinitialized=True)
-    except EOFError:
-        os.remove(path)
-    except FileNotFoundError:
-        pass
+    name = f"{key}.p"
+    if name in index:
+        path = base_path.joinpath(name)
+        try:
+            return AssetData(asset.__class__, _read_pickle(path), preinitialized=True)
+        except EOFError:
+            os.remove(path)
+            index.discard(name)
+        except FileNotFoundError:
+            index.discard(name)
 
-    # Getting the data from raw files
-    path = base_path.joinpath(f"{key}.csv")
-    try:
-        return AssetData(asset.__class__, path)
-    except Exception:
-        return None
+    # Getting the data from raw parquet files (requires a parquet engine)
+    name = f"{key}.parquet"
+    if name in index:
+        try:
+            return AssetData(asset.__class__, pd.read_parquet(base_path.joinpath(name)))
+        except Exception:
+            # Unreadable parquet files (or a missing engine) defer to the csv
+            pass
+
+    # Getting the data from raw csv files
+    name = f"{key}.csv"
+    if name in index:
+        try:
+            return AssetData(asset.__class__, base_path.joinpath(name))
+        except Exception:
+            return None
+
+    return None
+
+
+def bulk_get_data(
+    assets: Iterable[Asset], max_workers: Optional[int] = None
+) -> dict[str, Optional[AssetData]]:
+    """
+    Accesses locally stored data relevant to many assets concurrently
+
+    Equivalent to calling get_data on each asset, but the loads are spread
+    across a thread pool. Unpickling holds the GIL, so pickled datasets are
+    effectively loaded one at a time; only file I/O and the parsing of csv
+    files (which pandas' C parser performs without the GIL) overlap between
+    threads.
+
+    Parameters:
+        assets:
+            The assets to retrieve data for
+
+        max_workers:
+            The maximum number of threads to use. Defaults to the
+            ThreadPoolExecutor default
+
+    Returns:
+        A dictionary of each asset's stored dataset, keyed by asset key. Values
+        are None for assets with no stored data
+    """
+    assets = list(assets)
+    keys = [asset.key for asset in assets]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(keys, executor.map(get_data, assets)))
+
+
+class _Schema(NamedTuple):
+    """The column settings of an asset type, in the AssetData column format"""
+
+    required: tuple[str, ...]
+    optional: tuple[str, ...]
+    close_value: Optional[str]
+    open_value: Optional[str]
+
+
+@lru_cache(maxsize=None)
+def _schema(asset_type: Type[Asset]) -> _Schema:
+    """
+    Returns the normalized column settings of an asset type
+
+    Column settings only depend on the asset type, so they are unpacked and
+    formatted once per type rather than once per dataset. Changes made to an
+    asset type's column settings after its first dataset has been created are
+    not reflected.
+
+    Parameters:
+        asset_type: The asset type whose settings are returned
+
+    Returns:
+        The asset type's required and optional columns, and its closing and
+        opening value columns
+    """
+    _, _, _, required, optional, close_value, open_value = asset_type.get_settings(
+        unpack=True
+    )
+    column_format = AssetData.column_format
+    return _Schema(
+        tuple(column_format(column) for column in (required or [])),
+        tuple(column_format(column) for column in (optional or [])),
+        column_format(close_value) if close_value else None,
+        column_format(open_value) if open_value else None,
+    )
 
 
 class AssetData:
@@ -134,7 +327,8 @@ class AssetData:
     AssetData datasets.
 
     AssetData accepts any of the following inputs:
-        * numbers (for assets with constant prices, or unit prices)
+        * numbers (for assets with constant prices, or unit prices). These
+          create constant datasets, which store no table and evaluate as False
         * os.path-like objects (eg. pathlib.Path)
         * file-object-like objects
         * array-like objects (lists, ndarray, etc.)
@@ -174,10 +368,36 @@ class AssetData:
         single_valued (bool):
             True if this AssetData defines only one of close_value and open_value,
             or if they are the same. False if both are defined and different.
+
+        price_dtype (Optional[type]):
+            The dtype that float64 columns are stored as. Defaults to None,
+            which keeps full precision. Set to np.float32 to halve the memory
+            used by price histories. Valuations are always returned as
+            float64, regardless of the storage dtype.
     """
 
+    __slots__ = (
+        "_arrays",
+        "_const",
+        "_data",
+        "_first",
+        "_last",
+        "close_value",
+        "open_value",
+        "resolution",
+        "single_valued",
+        "__weakref__",
+    )
+
+    _const: Optional[float]
+    _data: Optional[pd.DataFrame]
+
+    price_dtype: Optional[type] = None
+
     _set_time_vectorized = np.vectorize(utils.set_time, excluded=["t"])
 
+    _datetime_arrays = ("_index_", "_period_open_", "_period_close_")
+
     def __init__(
         self,
         asset_type: Type[Asset],
@@ -185,6 +405,25 @@ class AssetData:
         columns: Optional[list[str]] = None,
         preinitialized: bool = False,
     ):
+        # Cache of numpy arrays used for valuation, populated lazily
+        self._arrays: dict[str, np.ndarray] = {}
+
+        # The price of constant datasets, None for tabular datasets
+        self._const = None
+
+        # Numeric inputs define constant prices, no table is necessary
+        if isinstance(data, AssetData) and data._const is not None:
+            data = data._const
+
+        if isinstance(data, Number):
+            self._data = None
+            self._const = float(data)  # type: ignore[arg-type]
+            self.close_value = _schema(asset_type).close_value or "CLOSE"
+            self.open_value = self.close_value
+            self.single_valued = True
+            self.resolution = self._global_res
+            self._first = self._last = datetime.combine(date.today(), time())
+            return
 
         # When the data is already initialized
         if preinitialized:
@@ -201,32 +440,16 @@ class AssetData:
                 )
             return
 
-        # Unpacking necessary values from the asset type
-        _, _, _, required, optional, close_value, open_value = asset_type.get_settings(
-            unpack=True
-        )
-
-        # Formatting required columns
-        required = required if required else []
-        required = [self.column_format(column) for column in required]
-
-        def numinit(n):
-            close_value = close_value if close_value else "CLOSE"
-            additions = ["DATE"]
-            if close_value not in required:
-                additions.append(close_value)
-            required = additions + required
-            frame = [[datetime.today().date()] + ([data] * (len(required) - 1))]
-            return pd.DataFrame(frame, columns=required)
+        # Unpacking necessary values from the asset type (already formatted)
+        schema = _schema(asset_type)
+        required = list(schema.required)
+        optional = list(schema.optional)
+        close_value, open_value = schema.close_value, schema.open_value
 
         # null case
         if data is None:
             return None
 
-        # Handle numeric inputs that default to static dataframes
-        elif isinstance(data, Number):
-            data = numinit(data)
-
         # Handle list inputs, np.ndarray inputs
         elif isinstance(data, (list, np.ndarray)):
             if not columns:
@@ -240,12 +463,14 @@ class AssetData:
         elif isinstance(data, AssetData):
             data = data.data
 
-        # Handle inputs that can be processed by pd.read_table
-        elif not isinstance(data, pd.DataFrame):
-            try:
-                data = pd.read_table(data, sep=",")
-            except (TypeError, ValueError) as e:
-                pass
+        # Handle paths and file-like objects, which are read as csv files
+        elif isinstance(data, (str, os.PathLike)) or hasattr(data, "read"):
+            data = pd.read_csv(
+                data,
+                sep=",",
+                engine="c",
+                memory_map=isinstance(data, os.PathLike),
+            )
 
         # Final check that we have valid data prior to formatting
         if isinstance(data, pd.DataFrame):
@@ -267,69 +492,35 @@ class AssetData:
             raise ValueError(f"Unable to create valid asset dataset from {data}")
 
         # Formatting columns
-        data.columns = [self.column_format(column) for column in data.columns]
-
-        # Grabbing "OPEN" and "CLOSE" by defauly if not specified
-        open_value = (
-            "OPEN" if ("OPEN" in data.columns and not open_value) else open_value
-        )
-        close_value = (
-            "CLOSE" if ("CLOSE" in data.columns and not close_value) else close_value
-        )
-
-        # Broadcasting open to close or close to open in case only one is provided
-        if close_value and not open_value:
-            close_value = self.column_format(close_value)
-            open_value = close_value
-            self.single_valued = True
-
-        elif open_value and not close_value:
-            open_value = self.column_format(open_value)
-            close_value = open_value
-            self.single_valued = True
+        data.columns = data.columns.str.replace(" ", "_", regex=False).str.upper()
 
-        # By this point both should be present if even one was provided
-        elif not all([close_value, open_value]):
+        # Grabbing "OPEN" and "CLOSE" by default if not specified
+        open_value = open_value or ("OPEN" if "OPEN" in data.columns else None)
+        close_value = close_value or ("CLOSE" if "CLOSE" in data.columns else None)
+        if not (open_value or close_value):
             raise ValueError(
                 "Must specify at least one opening or "
                 "closing value name present in the data"
             )
 
-        # Both an open and close have been explicitly provided
-        else:
-            open_value = self.column_format(open_value)
-            close_value = self.column_format(close_value)
-            self.single_valued = False
-
-        # Attribute initialization
-        self.open_value = open_value
-        self.close_value = close_value
-
-        # Adding default required columns (open, close, date)
-        if close_value:
-            required = [close_value] + required
-
-        if open_value:
-            required = [open_value] + required
-
-        required = ["DATE"] + required
-
-        # Removing duplicates
-        required = list(set(required))
+        # Broadcasting open to close or close to open in case only one is provided
+        self.single_valued = not (open_value and close_value)
+        open_value = open_value or close_value
+        close_value = close_value or open_value
+        assert open_value and close_value
+        self.open_value, self.close_value = open_value, close_value
 
-        # Both of the values (open and close) must be in required
-        if not all([value in required for value in [open_value, close_value]]):
-            raise ValueError(
-                "Must specify at least one opening or "
-                "closing value name present in the data"
-            )
+        # Adding default required columns (date, open, close), removing duplicates
+        required = list(dict.fromkeys(["DATE", open_value, close_value, *required]))
 
         # Final formatting requirements
         data = self._init_columns(data, required, optional)  # type: ignore[arg-type]
 
-        # Setting date column as DatetimeIndex
-        data = data.set_index(pd.DatetimeIndex(data["DATE"]))
-        data.drop("DATE", axis=1, inplace=True)
+        # Setting date column as DatetimeIndex. data is already a fresh
+        # projection, so it is safe to modify in place rather than copying
+        if not pd.api.types.is_datetime64_any_dtype(data["DATE"]):
+            data["DATE"] = pd.to_datetime(data["DATE"], cache=True)
+        data.set_index("DATE", inplace=True)
 
         self._data = data
         self.resolution, success = self._init_resolution()
@@ -369,31 +560,40 @@ class AssetData:
             self._first, self._last = t, t
 
     def __getattr__(self, attr: str) -> Any:
-        try:
-            return self.data.__getattr__(attr)
-        except AttributeError:
+        # Unset slots (eg. before unpickling) must not be delegated to the data
+        if attr not in AssetData.__slots__:
             try:
-                return self.data[attr]
-            except KeyError as e:
-                raise AttributeError(f"'AssetData' object has no attribute {e}")
+                return getattr(self.data, attr)
+            except AttributeError:
+                pass
+        raise AttributeError(f"'AssetData' object has no attribute '{attr}'")
 
     def __getitem__(self, item: Any) -> Any:
         return self.data[item]
 
     def __str__(self) -> str:
+        if self._data is None:
+            return str(self._const)
         return self.data.__str__()
 
     def __bool__(self) -> bool:
-        return not self._data.empty
+        return self._data is not None and not self._data.empty
 
     def __getstate__(self) -> dict[str, Any]:
-        return self.__dict__
+        state = {
+            attr: getattr(self, attr)
+            for attr in self.__slots__
+            if attr != "__weakref__" and hasattr(self, attr)
+        }
+        state["_arrays"] = {}
+        return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
-        self.__dict__ = state
+        for attr, value in state.items():
+            setattr(self, attr, value)
 
     def __len__(self) -> int:
-        return len(self._data)
+        return 0 if self._data is None else len(self._data)
 
     @property
     def first(self) -> datetime:
@@ -407,11 +607,157 @@ class AssetData:
 
     @property
     def data(self) -> pd.DataFrame:
-        """The data associated with this Asset Dataset"""
+        """The data associated with this Asset Dataset. Empty for constant
+        datasets"""
+        if self._data is None:
+            return pd.DataFrame()
         return self._data.drop(
             ["_time_resolution_", "_period_open_", "_period_close_"], axis=1
         )
 
+    def _array(self, column: str) -> np.ndarray:
+        """
+        Returns the values of a column as a cached numpy array
+
+        The index (requested as "_index_") and the period columns are returned
+        as int64 nanosecond timestamps so that they can be searched directly
+        with np.searchsorted. Price columns are always returned as numpy
+        buffers, including columns stored with pandas extension dtypes.
+
+        Parameters:
+            column: The name of the column, or "_index_" for the index
+
+        Returns:
+            The values of the column as a numpy array
+        """
+        try:
+            return self._arrays[column]
+        except KeyError:
+            pass
+
+        assert self._data is not None
+        values: Union[pd.Index, pd.Series]
+        values = self._data.index if column == "_index_" else self._data[column]
+        if column in self._datetime_arrays:
+            index = pd.DatetimeIndex(values)
+
+            # pandas >= 2 may store second/milli/microsecond resolution
+            # indexes, but queries are compared against nanosecond timestamps
+            if hasattr(index, "as_unit"):
+                index = index.as_unit("ns")
+            array = index.asi8
+
+        # Extension arrays (eg. pyarrow-backed or nullable float columns) would
+        # otherwise produce object arrays, so they are read into plain float
+        # buffers with missing values as NaN
+        elif pd.api.types.is_extension_array_dtype(values.dtype):
+            dtype = self.price_dtype or np.float64
+            array = values.to_numpy(dtype=dtype, na_value=np.nan)
+
+        else:
+            array = values.to_numpy()
+
+        self._arrays[column] = array
+        return array
+
+    @staticmethod
+    def _stack(
+        datasets: list[AssetData], open_value: str, close_value: str
+    ) -> dict[str, np.ndarray]:
+        """
+        Concatenates the valuation arrays of many datasets into flat arrays
+
+        Parameters:
+            datasets:
+                The (non-empty) datasets to stack
+
+            open_value:
+                The column associated with market open in all datasets
+
+            close_value:
+                The column associated with market close in all datasets
+
+        Returns:
+            A dictionary of the stacked arrays. Dataset boundaries are given by
+            "_offsets_", each dataset's first available date by "_first_", and
+            the composite search keys by "_keys_"
+        """
+        stacked = {
+            column: np.concatenate([dataset._array(column) for dataset in datasets])
+            for column in AssetData._datetime_arrays
+        }
+
+        # Prices are stacked as float64, regardless of their storage dtype
+        for column in (open_value, close_value):
+            stacked[column] = np.concatenate(
+                [dataset._array(column) for dataset in datasets]
+            ).astype(np.float64, copy=False)
+
+        lengths = [len(dataset) for dataset in datasets]
+        stacked["_offsets_"] = np.concatenate(([0], np.cumsum(lengths)))
+        stacked["_first_"] = np.array(
+            [pd.Timestamp(dataset.first).value for dataset in datasets]
+        )
+
+        # A monotone composite key (segment * span + timestamp rank) lets every
+        # dataset be searched at once. Ranks among the unique timestamps are
+        # used rather than raw nanoseconds so that the key can not overflow
+        unique = np.unique(stacked["_index_"])
+        span = len(unique) + 1
+        segments = np.repeat(np.arange(len(datasets), dtype=np.int64), lengths)
+        stacked["_unique_"] = unique
+        stacked["_segments_"] = np.arange(len(datasets), dtype=np.int64) * span
+        stacked["_keys_"] = segments * span + np.searchsorted(
+            unique, stacked["_index_"]
+        )
+        return stacked
+
+    @staticmethod
+    def _valuate_stacked(
+        stacked: dict[str, np.ndarray],
+        date: DatetimeLike,
+        open_value: str,
+        close_value: str,
+    ) -> np.ndarray:
+        """
+        Valuates every dataset in a stack on the given date at once
+
+        Vectorized equivalent of calling valuate on each of the stacked
+        datasets. Datasets whose valuation would require stepping back to a
+        previous period are returned as NaN.
+
+        Parameters:
+            stacked:
+                Stacked valuation arrays, as returned by AssetData._stack
+
+            date (DatetimeLike):
+                The datetime whose associated price information is requested
+
+            open_value:
+                The column associated with market open in all datasets
+
+            close_value:
+                The column associated with market close in all datasets
+
+        Returns:
+            The price of each dataset at the given datetime
+        """
+        ts = np.maximum(pd.Timestamp(utils.to_datetime(date)).value, stacked["_first_"])
+
+        # Keys below the query key are the index values at or before ts within
+        # each dataset, so one binary search performs every asof lookup
+        ranks = np.searchsorted(stacked["_unique_"], ts, side="right")
+        i = np.searchsorted(stacked["_keys_"], stacked["_segments_"] + ranks) - 1
+        i = np.maximum(i, stacked["_offsets_"][:-1])
+
+        return np.where(
+            ts >= stacked["_period_close_"][i],
+            stacked[close_value][i],
+            np.where(
+                ts >= stacked["_period_open_"][i], stacked[open_value][i], np.nan
+            ),
+        )
+
     def _init_columns(
         self,
         data: pd.DataFrame,
@@ -475,12 +821,9 @@ class AssetData:
         optional = to_dict(optional)
 
         # Checking whether all of the required columns have been satisfied
-        satisfied = {column: (column in data.columns) for column in required}
-        unsatisfied: Any = [
-            column for column, present in satisfied.items() if not present
-        ]
-        if unsatisfied:
-            unsatisfied = str(unsatisfied)[1:-1]
+        missing = pd.Index(list(required)).difference(data.columns, sort=False)
+        if len(missing):
+            unsatisfied = str(missing.to_list())[1:-1]
             raise ValueError(f"AssetData missing required columns: {unsatisfied}")
 
         # Coercing dtypes to those specified in required and optional
@@ -491,10 +834,15 @@ class AssetData:
                 self.data[column] = self.data[column].astype(dtype)
         """
 
-        # Dropping columns that are not present in optional or required
-        for column in data.columns:
-            if column not in list(required) + list(optional):
-                data.drop(column, axis=1, inplace=True)
+        # Keeping only the columns present in optional or required
+        data = data.loc[
+            :, data.columns.intersection(list(required) + list(optional), sort=False)
+        ]
+
+        # Storing float columns at the configured precision
+        if self.price_dtype is not None:
+            for column in data.select_dtypes(include="float64").columns:
+                data[column] = data[column].astype(self.price_dtype)
 
         return data
 
@@ -771,12 +1119,15 @@ class AssetData:
             The price information at the given datetime
         """
         date = max(self.first, utils.to_datetime(date))
-        # Calling asof on the index is WAY faster than calling it directly on the frame
-        data = self._data.loc[self._data.index.asof(date)]
-        if date >= data["_period_close_"]:
-            return data[asset.close_value]
-        elif date >= data["_period_open_"]:
-            return data[asset.open_value]
+
+        # Binary search over the raw index values, equivalent to index.asof
+        ts = pd.Timestamp(date).value
+        i = max(np.searchsorted(self._array("_index_"), ts, side="right") - 1, 0)
+
+        if ts >= self._array("_period_close_")[i]:
+            return float(self._array(asset.close_value)[i])
+        elif ts >= self._array("_period_open_")[i]:
+            return float(self._array(asset.open_value)[i])
         else:
             return self.valuate(self.prev(date), asset)
 
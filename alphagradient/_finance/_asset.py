@@ -17,12 +17,13 @@ Todo:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, MutableMapping
 from datetime import datetime, time, timedelta
 from functools import lru_cache
 import math
 from numbers import Number
 from pathlib import Path
-from weakref import WeakValueDictionary as WeakDict
+from weakref import ref
 
 # Third Party imports
 from aenum import Enum, unique, auto, extend_enum
@@ -31,6 +32,7 @@ import numpy as np
 
 # Local imports
 from .._data import get_data, AssetData, ValidData
+from .._data._datatools import _index_data_file
 from .. import utils
 
 # Typing
@@ -59,22 +61,77 @@ _currency_info: pd.DataFrame = pd.read_pickle(_currency_info_path)
 """Currency information stored locally"""
 
 
-class Instances(WeakDict):
+class Instances(MutableMapping):
     """A weakly referential dictionary of all instances of the
-    subclass to which the enum member corresponds"""
+    subclass to which the enum member corresponds
+
+    Instances are stored as plain weak references in a regular dictionary.
+    Each reference removes its own entry when its instance is garbage
+    collected, so lookups never need to account for pending removals."""
 
     def __init__(self, name: str) -> None:
         self.name = name
-        super().__init__()
+        self._refs: dict[str, ref] = {}
 
     def __getattr__(self, attr: str) -> Any:
+        if attr == "_refs":
+            raise AttributeError(attr)
         try:
             return self[attr.upper()]
         except KeyError:
             raise AttributeError(f"Asset type '{self.name}' has no instance '{attr}'")
 
+    def __getitem__(self, key: str) -> Any:
+        instance = self._refs[key]()
+        if instance is None:
+            raise KeyError(key)
+        return instance
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        refs = self._refs
+
+        def remove(wr: ref, key: str = key) -> None:
+            # The key may have been reassigned since this reference was made
+            if refs.get(key) is wr:
+                del refs[key]
+
+        refs[key] = ref(value, remove)
+
+    def __delitem__(self, key: str) -> None:
+        del self._refs[key]
+
+    def __contains__(self, key: object) -> bool:
+        wr = self._refs.get(key)  # type: ignore[call-overload]
+        return wr is not None and wr() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._refs))
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
     def __str__(self) -> str:
-        return str(dict(self))
+        return str(dict(self.items()))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        wr = self._refs.get(key)
+        instance = None if wr is None else wr()
+        return default if instance is None else instance
+
+    def items(self) -> list[tuple[str, Any]]:  # type: ignore[override]
+        items = [(key, wr()) for key, wr in list(self._refs.items())]
+        return [(key, instance) for key, instance in items if instance is not None]
+
+    def values(self) -> list[Any]:  # type: ignore[override]
+        instances = [wr() for wr in list(self._refs.values())]
+        return [instance for instance in instances if instance is not None]
+
+    def copy(self) -> Instances:
+        """Returns a new weakly referential dictionary of the same instances"""
+        new = Instances(self.name)
+        for key, instance in self.items():
+            new[key] = instance
+        return new
 
     @property
     def base(self) -> Currency:
@@ -128,35 +185,9 @@ class types(Enum):
             True
     """
 
-    def _generate_next_value_(name: str, *args: Any) -> tuple[str, WeakDict]:
+    def _generate_next_value_(name: str, *args: Any) -> tuple[str, Instances]:
         """Determines how new enum members are generated when new asset
         subclasses are created"""
-
-        class _Instances(WeakDict):
-            """A weakly referential dictionary of all instances of the
-            subclass to which the enum member corresponds"""
-
-            def __getattr__(self, attr: str) -> Any:
-                try:
-                    return self[attr.upper()]
-                except KeyError:
-                    raise AttributeError(
-                        f"Asset type '{name}' has no instance '{attr}'"
-                    )
-
-            def __str__(self) -> str:
-                return str(dict(self))
-
-            @property
-            def base(self) -> Currency:
-                """The monetary basis of this asset subclass,
-                represented by a currency code. Only used by Currency
-                subclass"""
-                if self and getattr(list(self.values())[0], "base", False):
-                    return [c for c in self.values() if c.is_base][0]
-                else:
-                    raise AttributeError(f"Asset type '{self}' has no instance 'base'")
-
         return (name, Instances(name))
 
     # Non-asset types that need to be instantiated manually
@@ -182,7 +213,7 @@ class types(Enum):
         return self.instances[item]
 
     @property
-    def instances(self) -> WeakDict[str, Any]:
+    def instances(self) -> Instances:
         """A list of all instances of a certain asset type"""
         return self.value[1]
 
@@ -409,6 +440,7 @@ class Asset(ABC):
     _optional: list[str] = [_open_value]
     _required: list[str] = [_close_value]
     _rfr: float
+    _stacked: tuple[list[ref], dict[str, np.ndarray]]
     _value: float
     _unit: str = "unit"
     _units: str = "units"
@@ -521,8 +553,9 @@ class Asset(ABC):
             name = kwargs["name"] if kwargs.get("name") else args[0]
 
             # Returning the asset if exists
-            if name in cls.type.instances:  # type: ignore[attr-defined]
-                return cls.type.instances[name]  # type: ignore[attr-defined]
+            instance = cls.type.instances.get(name)  # type: ignore[attr-defined]
+            if instance is not None:
+                return instance
 
         # Returning a new asset
         return cast(Asset, super().__new__(cls))
@@ -637,8 +670,13 @@ class Asset(ABC):
             else:
                 self._data = AssetData(self.__class__, data, columns)
 
-            # Data verification when required
-            if self.protocol is DataProtocol.REQUIRED and not self.data:
+            # Data verification when required (constant datasets are valid)
+            const = getattr(self._data, "_const", None)
+            if (
+                self.protocol is DataProtocol.REQUIRED
+                and not self.data
+                and const is None
+            ):
                 raise ValueError(
                     f"{self.name} {self.type} could not "  # type: ignore[attr-defined]
                     "be initialized without data. If this "
@@ -891,6 +929,9 @@ class Asset(ABC):
             The price as of the given datetime
         """
         assert self.data is not None
+        if self.data._const is not None:
+            return self.data._const
+
         date = self.date if date is None else utils.to_datetime(date)
         value = float(self.data.valuate(date, self))  # TODO Should this use quote??
         if not math.isnan(value):
@@ -906,8 +947,10 @@ class Asset(ABC):
         """Saves this asset's data locally"""
         if self.data and self._global_persistent_path is not None:
             path = self._global_persistent_path.joinpath(f"{self.key}.p")
+            mtime = self._global_persistent_path.stat().st_mtime_ns
             with open(path, "wb") as p:
                 self.data._data.to_pickle(p)
+            _index_data_file(path, mtime)
 
     def _step(self, date: DatetimeLike) -> None:
         """
@@ -1061,6 +1104,60 @@ class Asset(ABC):
 
         return list(settings.values()) if unpack else settings
 
+    @classmethod
+    def valuate_all(cls, date: Optional[DatetimeLike] = None) -> None:
+        """
+        Valuates all instances of this asset type at once
+
+        Rather than searching each asset's dataset individually, the datasets
+        of all instances of this type are stacked into flat arrays (rebuilt
+        only when the instances change) and valuated in a single vectorized
+        pass. Assets without data, or whose valuation could not be resolved
+        from the stacked arrays, are valuated individually.
+
+        Parameters:
+            date (DatetimeLike):
+                The date on which to valuate the assets. Defaults to the
+                current date
+
+        Examples:
+
+            .. code:: python
+
+                # Valuate all instantiated stocks at the current date
+                ag.Stock.valuate_all()
+        """
+        instances = list(cls.type.instances.values())  # type: ignore[attr-defined]
+        if not instances:
+            return
+
+        date = instances[0].date if date is None else utils.to_datetime(date)
+        open_value, close_value = instances[0].open_value, instances[0].close_value
+
+        prices: Any = iter(())
+        datasets = [asset.data for asset in instances if asset.data]
+        if datasets:
+            stacked = cls.__dict__.get("_stacked")
+            if stacked is None or [wr() for wr in stacked[0]] != datasets:
+
+                # The stack only weakly references its datasets, and is
+                # discarded as soon as any of them is garbage collected
+                def discard(wr: ref) -> None:
+                    current = cls.__dict__.get("_stacked")
+                    if current is not None and wr in current[0]:
+                        del cls._stacked
+
+                refs = [ref(dataset, discard) for dataset in datasets]
+                arrays = AssetData._stack(datasets, open_value, close_value)
+                stacked = cls._stacked = (refs, arrays)
+            prices = iter(
+                AssetData._valuate_stacked(stacked[1], date, open_value, close_value)
+            )
+
+        for asset in instances:
+            price = next(prices) if asset.data else math.nan
+            asset.value = asset.quote(date) if math.isnan(price) else float(price)
+
     def ma(self, days: float = 365) -> float:
         """
         Returns the moving average of this asset's value over the period given by days
@@ -1092,6 +1189,8 @@ class Asset(ABC):
         date = utils.to_datetime(date)
         if self.data:
             return self.data.valuate(date, self)
+        elif getattr(self._data, "_const", None) is not None:
+            return self._data._const  # type: ignore[union-attr]
         else:
             return self.valuate(date)
 
@@ -1384,6 +1384,7 @@ class Universe(dict):
         if self.refresh:
             self.local_p = []
             self.local_csv = []
+            self.local_parquet = []
             self.local = []
         else:
             pickle_path: Path = self._global_persistent_path
@@ -1402,7 +1403,16 @@ class Universe(dict):
                     if f.startswith("STOCK_") and f.endswith(".csv")
                 ]
             )
-            self.local = sorted(list(set(self.local_p + self.local_csv)))
+            self.local_parquet = sorted(
+                [
+                    f[6:-8]
+                    for f in os.listdir(raw_path)
+                    if f.startswith("STOCK_") and f.endswith(".parquet")
+                ]
+            )
+            self.local = sorted(
+                list(set(self.local_p + self.local_csv + self.local_parquet))
+            )
 
     def update_tickers(self) -> None:
         """Updates the exchange info for this universe object by getting stock
@@ -12,6 +12,7 @@ from datetime import (
     time,
     timedelta,
 )
+from functools import lru_cache
 import math
 from pathlib import Path
 
@@ -66,6 +67,13 @@ if TYPE_CHECKING:
 _global_persistent_path: PropertyType[Path]
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso(datestring: str) -> datetime:
+    """Memoized datetime.fromisoformat, for datestrings that are converted
+    repeatedly (eg. the same date passed to every asset during a step)"""
+    return datetime.fromisoformat(datestring)
+
+
 def auto_batch(iterable: Iterable) -> Generator:
     """
     Returns a generator which yields automatically sized batches
@@ -685,7 +693,7 @@ def to_datetime(dtlike: DatetimeLike) -> datetime:
     elif isinstance(dtlike, date):
         return datetime.combine(dtlike, datetime.min.time())
     elif isinstance(dtlike, str):
-        return datetime.fromisoformat(dtlike)
+        return _parse_iso(dtlike)
 
     raise TypeError(f"Can not convert passed object {dtlike} to python datetime")
 
@@ -721,7 +729,7 @@ def to_step(current: datetime, delta: Union[DateOrTime, timedelta, float]) -> ti
         try:
             delta = set_time(current, read_timestring(delta))
         except ValueError:
-            delta = datetime.fromisoformat(delta)  # type: ignore[arg-type]
+            delta = _parse_iso(delta)  # type: ignore[arg-type]
 
     elif isinstance(delta, time):
         delta = set_time(current, delta)
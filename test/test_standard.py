@@ -1,14 +1,223 @@
 from datetime import datetime
 import unittest
+import gc
 import os
 import sys
 import inspect
+import tempfile
+import weakref
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
 import alphagradient as ag
+from alphagradient._data import _datatools
+from alphagradient._finance._asset import Instances
+
+
+class Referent:
+    """A weakly referenceable stand-in for an asset"""
+
+
+def make_prices(start, end, freq):
+    """Returns a price history with increasing open and close prices"""
+    index = pd.date_range(start, end, freq=freq, name="DATE")
+    prices = np.arange(len(index), dtype=np.float64) + 1
+    return pd.DataFrame({"OPEN": prices, "CLOSE": prices + 0.5}, index=index)
+
+
+def advance_mtime(path):
+    """Advances the modification time of a directory, as if time had passed
+    since its last change (file system timestamps may be coarse)"""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
 
 class Standard(unittest.TestCase):
 
     def test_stock(self):
         self.assertEquals(1, 1)
 
+    def test_constant_asset(self):
+        stock = ag.Stock("CONSTANT_TEST", data=5.0)
+        self.assertEqual(stock.quote(datetime.today()), 5.0)
+
+        data = _datatools.AssetData(ag.Stock, 5)
+        self.assertFalse(data)
+        self.assertEqual(len(data), 0)
+
+
+class ValuateAll(unittest.TestCase):
+
+    def test_matches_quote(self):
+        # Mismatched ranges and frequencies
+        stocks = [
+            ag.Stock("STACK_A", data=make_prices("2020-01-01", "2021-12-31", "B")),
+            ag.Stock("STACK_B", data=make_prices("2020-06-01", "2022-06-01", "W")),
+            ag.Stock("STACK_C", data=make_prices("2021-01-01", "2021-03-01", "D")),
+            ag.Stock("STACK_D", data=make_prices("2019-06-01", "2020-09-01", "MS")),
+        ]
+
+        # Includes dates before every asset's first row and after their last
+        dates = [datetime(2000, 1, 1)]
+        dates += list(pd.date_range("2019-01-01", "2023-01-01", freq="44h"))
+        for date in dates:
+            ag.Stock.valuate_all(date)
+            for stock in stocks:
+                self.assertEqual(stock.value, stock.quote(date), (stock, date))
+                self.assertIs(type(stock.value), float)
+
+    def test_stack_released(self):
+        stock = ag.Stock("STACK_TEMP", data=make_prices("2020-01-01", "2020-12-31", "B"))
+        ag.Stock.valuate_all(datetime(2020, 6, 1))
+        dataset = weakref.ref(stock.data)
+
+        del stock
+        gc.collect()
+        self.assertIsNone(dataset())
+        self.assertNotIn("_stacked", ag.Stock.__dict__)
+
+
+class DataIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+        self.persistent = ag.globals._persistent
+        ag.globals._persistent = self.path
+        _datatools._invalidate_data_index()
+
+    def tearDown(self):
+        ag.globals._persistent = self.persistent
+        _datatools._invalidate_data_index()
+        self.tmp.cleanup()
+
+    def test_external_file(self):
+        self.assertEqual(_datatools._get_data_index(self.path), set())
+
+        # Written by another process after the first scan
+        self.path.joinpath("STOCK_EXTERNAL.csv").touch()
+        advance_mtime(self.path)
+        self.assertIn("STOCK_EXTERNAL.csv", _datatools._get_data_index(self.path))
+
+    def test_save_registers_pickle(self):
+        index = _datatools._get_data_index(self.path)
+        ag.Stock("INDEX_SAVE", data=make_prices("2020-01-01", "2020-03-01", "B"))
+
+        # The pickle is indexed without the directory being scanned again
+        self.assertIs(_datatools._get_data_index(self.path), index)
+        self.assertIn("STOCK_INDEX_SAVE.p", index)
+        self.assertTrue(self.path.joinpath("STOCK_INDEX_SAVE.p").exists())
+
+    def test_missing_directory(self):
+        path = self.path.joinpath("alphagradient.persistent")
+        self.assertEqual(_datatools._get_data_index(path), set())
+
+        path.mkdir()
+        path.joinpath("STOCK_LATER.csv").touch()
+        self.assertIn("STOCK_LATER.csv", _datatools._get_data_index(path))
+
+    def test_empty_pickle_falls_back_to_csv(self):
+        prices = make_prices("2020-01-01", "2020-03-01", "B")
+        stock = ag.Stock("INDEX_EMPTY", data=prices.copy())
+
+        # An interrupted save leaves an empty pickle next to a valid csv
+        pickle_path = self.path.joinpath(f"{stock.key}.p")
+        pickle_path.write_bytes(b"")
+        prices.to_csv(self.path.joinpath(f"{stock.key}.csv"))
+        advance_mtime(self.path)
+
+        data = _datatools.get_data(stock)
+        self.assertIsNotNone(data)
+        self.assertEqual(len(data), len(prices))
+        self.assertFalse(pickle_path.exists())
+
+    def test_bulk_get_data(self):
+        stocks = [
+            ag.Stock(f"BULK_{i}", data=make_prices("2020-01-01", "2020-03-01", "B"))
+            for i in range(3)
+        ]
+
+        # Raw csv data, and an asset with no stored data at all
+        make_prices("2020-01-01", "2020-06-01", "W").to_csv(
+            self.path.joinpath("STOCK_BULK_CSV.csv")
+        )
+        advance_mtime(self.path)
+        stocks.append(ag.Stock("BULK_CSV"))
+        stocks.append(ag.Stock("BULK_NONE", data=1.0))
+
+        bulk = _datatools.bulk_get_data(stocks, max_workers=2)
+        self.assertEqual(list(bulk), [stock.key for stock in stocks])
+        for stock in stocks:
+            data = _datatools.get_data(stock)
+            if data is None:
+                self.assertIsNone(bulk[stock.key])
+            else:
+                self.assertTrue(bulk[stock.key].data.equals(data.data))
+        self.assertIsNone(bulk["STOCK_BULK_NONE"])
+
+
+class InstancesMapping(unittest.TestCase):
+
+    def test_reassigned_key(self):
+        instances = Instances("test")
+        old, new = Referent(), Referent()
+        instances["KEY"] = old
+        instances["KEY"] = new
+
+        # Collecting the old instance must not remove the new entry
+        del old
+        gc.collect()
+        self.assertIs(instances["KEY"], new)
+        self.assertEqual(len(instances), 1)
+
+    def test_collected_instances(self):
+        instances = Instances("test")
+        kept, dropped = Referent(), Referent()
+        instances["KEPT"] = kept
+        instances["DROPPED"] = dropped
+
+        del dropped
+        gc.collect()
+        self.assertIn("KEPT", instances)
+        self.assertNotIn("DROPPED", instances)
+        self.assertIsNone(instances.get("DROPPED"))
+        self.assertEqual(instances.get("DROPPED", 1), 1)
+        self.assertIs(instances.get("KEPT"), kept)
+        self.assertEqual(len(instances), 1)
+        self.assertEqual(instances.items(), [("KEPT", kept)])
+        self.assertEqual(instances.values(), [kept])
+        self.assertEqual(list(instances), ["KEPT"])
+        with self.assertRaises(KeyError):
+            instances["DROPPED"]
+
+    def test_attribute_access(self):
+        instances = Instances("test")
+        instance = Referent()
+        instances["KEY"] = instance
+
+        self.assertIs(instances.key, instance)
+        with self.assertRaises(AttributeError):
+            instances.missing
+        self.assertFalse(hasattr(instances, "missing"))
+
+    def test_copy(self):
+        instances = Instances("test")
+        instance = Referent()
+        instances["KEY"] = instance
+
+        copy = instances.copy()
+        self.assertIsInstance(copy, Instances)
+        self.assertEqual(copy.name, "test")
+        self.assertEqual(copy.items(), instances.items())
+
+        # Copies are independent, and still only weakly reference instances
+        copy["OTHER"] = other = Referent()
+        self.assertNotIn("OTHER", instances)
+        del instance
+        gc.collect()
+        self.assertEqual(copy.items(), [("OTHER", other)])
+        self.assertEqual(len(instances), 0)
+
 if __name__ == '__main__':
     unittest.main()